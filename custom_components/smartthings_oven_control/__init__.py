@@ -4,39 +4,109 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import voluptuous as vol
+
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import DeviceInfo, async_get as async_get_dev_reg
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity_registry import async_get as async_get_ent_reg
+from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .accounts import register_device_account, unregister_device_account
+from .clock_sync import ClockDriftMonitor
+from .cook_state import CookStateEstimator
+from .cassette import (
+    async_run_replay_load,
+    async_save_recording,
+    async_set_traffic_mode,
+    cassette_filename,
+)
+from .const import (
+    ATTR_FILENAME,
+    ATTR_MODE,
+    ATTR_SPEED,
+    ATTR_WAIT_FOR_CONFIRMATION,
+    CONF_ACCOUNT_ID,
+    DEFAULT_CASSETTE_FILENAME,
+    DOMAIN,
+    SERVICE_REPLAY_LOAD,
+    SERVICE_SET_TRAFFIC_MODE,
+    SERVICE_START_COOKING,
+    SERVICE_SYNC_TIME,
+    SIGNAL_FLEET_UPDATED,
+    TRAFFIC_MODES,
+)
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
 # Define platforms that this integration provides
-PLATFORMS = [Platform.SELECT, Platform.NUMBER, Platform.BUTTON]
+PLATFORMS = [Platform.SELECT, Platform.NUMBER, Platform.BUTTON, Platform.SENSOR]
+
+START_COOKING_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+        vol.Optional(ATTR_WAIT_FOR_CONFIRMATION, default=False): cv.boolean,
+    }
+)
+
+SYNC_TIME_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+    }
+)
+
+SET_TRAFFIC_MODE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_MODE): vol.In(TRAFFIC_MODES),
+        vol.Optional(ATTR_FILENAME, default=DEFAULT_CASSETTE_FILENAME): cassette_filename,
+        vol.Optional(ATTR_SPEED, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
+REPLAY_LOAD_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_FILENAME, default=DEFAULT_CASSETTE_FILENAME): cassette_filename,
+        vol.Optional(ATTR_SPEED, default=1.0): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SmartThings Oven Control from a config entry."""
     hass.data.setdefault(DOMAIN, {})
     
-    # Validate that SmartThings token is available
+    # Validate that the token of the account owning the device is available.
+    # Entries created before multi-account support use the first account.
     try:
-        from .token_utils import get_smartthings_token
-        access_token = await get_smartthings_token(hass)
-        if not access_token:
+        from .token_utils import get_smartthings_account_token
+        account_token = await get_smartthings_account_token(
+            hass, entry.data.get(CONF_ACCOUNT_ID)
+        )
+        if not account_token:
             raise ConfigEntryNotReady("SmartThings integration not found or token expired")
     except Exception as e:
         _LOGGER.error("Failed to get SmartThings token: %s", e)
         raise ConfigEntryNotReady("Failed to access SmartThings token") from e
+    account_id, access_token = account_token
+    
+    if CONF_ACCOUNT_ID not in entry.data:
+        # Pin the entry to the account whose token it uses, so its requests
+        # share that account's dispatcher and rate budget
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_ACCOUNT_ID: account_id}
+        )
     
     # Store the config entry data with default values
     hass.data[DOMAIN][entry.entry_id] = {
         "device_id": entry.data["device_id"],
         "friendly_name": entry.data.get("friendly_name", "Oven"),
         "access_token": access_token,
+        "account_id": account_id,
         "oven_mode": "Bake",
         "oven_temperature": 350.0,
         "oven_cook_time": 30.0,
@@ -58,9 +128,27 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         **device_info
     )
     
+    register_device_account(hass, entry.data["device_id"], account_id)
+    
+    # Watch the oven clock and re-sync it only when it drifts
+    clock_monitor = ClockDriftMonitor(hass, entry.data["device_id"], access_token)
+    clock_monitor.async_start()
+    hass.data[DOMAIN][entry.entry_id]["clock_monitor"] = clock_monitor
+    
+    # Extrapolate cook state locally between status updates
+    cook_state = CookStateEstimator(hass, entry.data["device_id"])
+    cook_state.async_start()
+    hass.data[DOMAIN][entry.entry_id]["cook_state"] = cook_state
+    
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    if not hass.services.has_service(DOMAIN, SERVICE_START_COOKING):
+        _async_register_services(hass)
+        async_register_websocket_commands(hass)
+    
+    async_dispatcher_send(hass, SIGNAL_FLEET_UPDATED, entry.data["device_id"])
+    
     return True
 
 
@@ -69,6 +157,79 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        # Keep what has been recorded so far if HA never switches modes again
+        await async_save_recording(hass)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data["clock_monitor"].async_stop()
+        entry_data["cook_state"].async_stop()
+        unregister_device_account(hass, entry_data["device_id"])
+        async_dispatcher_send(hass, SIGNAL_FLEET_UPDATED, entry_data["device_id"])
     
     return unload_ok
+
+
+def _get_buttons(hass: HomeAssistant, entity_ids: list[str], button_class: type) -> list[Any]:
+    """Return the button entities behind entity IDs, checking their kind."""
+    entity_registry = async_get_ent_reg(hass)
+    entities = hass.data[DOMAIN].get("entities", {})
+    buttons = []
+    for entity_id in entity_ids:
+        registry_entry = entity_registry.async_get(entity_id)
+        button = entities.get(registry_entry.unique_id) if registry_entry else None
+        if not isinstance(button, button_class):
+            raise HomeAssistantError(
+                f"{entity_id} is not a SmartThings Oven Control {button_class.__name__}"
+            )
+        buttons.append(button)
+    return buttons
+
+
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    from .button import OvenStartButton, OvenSyncTimeButton
+
+    async def async_start_cooking(call: ServiceCall) -> None:
+        """Start the ovens behind the given start buttons."""
+        for button in _get_buttons(hass, call.data[ATTR_ENTITY_ID], OvenStartButton):
+            await button.async_start_cooking(
+                wait_for_confirmation=call.data[ATTR_WAIT_FOR_CONFIRMATION]
+            )
+
+    async def async_sync_time(call: ServiceCall) -> None:
+        """Sync the clocks of the ovens behind the given sync buttons."""
+        for button in _get_buttons(hass, call.data[ATTR_ENTITY_ID], OvenSyncTimeButton):
+            await button.async_press()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_START_COOKING, async_start_cooking, schema=START_COOKING_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_SYNC_TIME, async_sync_time, schema=SYNC_TIME_SCHEMA
+    )
+
+    async def async_handle_set_traffic_mode(call: ServiceCall) -> None:
+        """Record or replay SmartThings API traffic."""
+        try:
+            await async_set_traffic_mode(
+                hass, call.data[ATTR_MODE], call.data[ATTR_FILENAME], call.data[ATTR_SPEED]
+            )
+        except (OSError, ValueError) as e:
+            raise HomeAssistantError(f"Cannot set traffic mode: {e}") from e
+
+    async def async_handle_replay_load(call: ServiceCall) -> None:
+        """Re-issue recorded traffic against the replay stub or simulator."""
+        try:
+            await async_run_replay_load(hass, call.data[ATTR_FILENAME], call.data[ATTR_SPEED])
+        except (OSError, ValueError) as e:
+            raise HomeAssistantError(f"Cannot replay load: {e}") from e
+
+    # These read and write files and can replace live traffic, so admin only
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_SET_TRAFFIC_MODE, async_handle_set_traffic_mode,
+        schema=SET_TRAFFIC_MODE_SCHEMA,
+    )
+    async_register_admin_service(
+        hass, DOMAIN, SERVICE_REPLAY_LOAD, async_handle_replay_load,
+        schema=REPLAY_LOAD_SCHEMA,
+    )
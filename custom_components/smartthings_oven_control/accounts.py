@@ -0,0 +1,39 @@
+"""Per-account request resources for SmartThings Oven Control."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from .cassette import wrap_session
+from .const import DOMAIN
+from .dispatch import DEFAULT_ACCOUNT
+
+
+def register_device_account(hass: HomeAssistant, device_id: str, account_id: str) -> None:
+    """Map a device to the SmartThings account that owns it."""
+    hass.data.setdefault(DOMAIN, {}).setdefault("device_accounts", {})[device_id] = account_id
+
+
+def unregister_device_account(hass: HomeAssistant, device_id: str) -> None:
+    """Forget the account mapping of a device."""
+    hass.data.get(DOMAIN, {}).get("device_accounts", {}).pop(device_id, None)
+
+
+def account_for_device(hass: HomeAssistant, device_id: str) -> str:
+    """Return the account a device's requests are charged to."""
+    return hass.data.get(DOMAIN, {}).get("device_accounts", {}).get(device_id, DEFAULT_ACCOUNT)
+
+
+def get_account_session(hass: HomeAssistant, account_id: str) -> Any:
+    """Return the HTTP session pool dedicated to an account.
+
+    While traffic is being recorded, replayed or simulated the pool is
+    wrapped by, or replaced with, a session of the same shape.
+    """
+    sessions = hass.data.setdefault(DOMAIN, {}).setdefault("sessions", {})
+    if account_id not in sessions:
+        # Closed by Home Assistant on shutdown
+        sessions[account_id] = async_create_clientsession(hass)
+    return wrap_session(hass, sessions[account_id])
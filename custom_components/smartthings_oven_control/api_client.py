@@ -7,9 +7,24 @@ from datetime import datetime
 
 import aiohttp
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 
-from .const import SMARTTHINGS_API_BASE
+from .accounts import account_for_device, get_account_session
+from .const import (
+    PRIORITY_BACKGROUND,
+    SIGNAL_FLEET_UPDATED,
+    SIGNAL_STATUS_UPDATED,
+    SMARTTHINGS_API_BASE,
+)
+from .clock_sync import oven_clock_reading
+from .command_guard import (
+    record_clock_drift,
+    record_command_sent,
+    record_status,
+    record_status_failure,
+)
+from .command_tracker import get_command_tracker
+from .dispatch import command_priority, get_dispatcher
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,9 +35,42 @@ async def execute_oven_command(
     access_token: str,
     capability: str,
     command: str,
-    arguments: list | None = None
+    arguments: list | None = None,
+    priority: int | None = None
 ) -> dict:
-    """Execute SmartThings REST API command."""
+    """Execute SmartThings REST API command.
+
+    The request is queued on the account's dispatcher. When no priority is
+    given, stop/pause go to the safety lane, vendor ``execute`` writes to the
+    background lane and everything else to the user lane.
+    """
+    if priority is None:
+        priority = command_priority(capability, command)
+
+    account_id = account_for_device(hass, device_id)
+    try:
+        return await get_dispatcher(hass, account_id).submit(
+            device_id,
+            priority,
+            lambda: _post_oven_command(
+                get_account_session(hass, account_id),
+                device_id, access_token, capability, command, arguments
+            ),
+        )
+    finally:
+        # Even a failed request may have reached the oven
+        record_command_sent(hass, device_id)
+
+
+async def _post_oven_command(
+    session: aiohttp.ClientSession,
+    device_id: str,
+    access_token: str,
+    capability: str,
+    command: str,
+    arguments: list | None
+) -> dict:
+    """Send a command to the SmartThings REST API."""
     url = f"{SMARTTHINGS_API_BASE}/devices/{device_id}/commands"
     
     headers = {
@@ -39,8 +87,6 @@ async def execute_oven_command(
     if arguments is not None:
         payload[0]["arguments"] = arguments
     
-    session = async_get_clientsession(hass)
-    
     try:
         async with session.post(url, headers=headers, json=payload) as response:
             if response.status == 401:
@@ -67,9 +113,41 @@ async def execute_oven_command(
 async def get_device_status(
     hass: HomeAssistant,
     device_id: str,
-    access_token: str
+    access_token: str,
+    priority: int = PRIORITY_BACKGROUND
 ) -> dict:
     """Get current device status."""
+    account_id = account_for_device(hass, device_id)
+    try:
+        status = await get_dispatcher(hass, account_id).submit(
+            device_id,
+            priority,
+            lambda: _fetch_device_status(
+                get_account_session(hass, account_id), device_id, access_token
+            ),
+        )
+    except Exception:
+        record_status_failure(hass, device_id)
+        async_dispatcher_send(hass, SIGNAL_FLEET_UPDATED, device_id)
+        raise
+    
+    record_status(hass, device_id, status)
+    reading = oven_clock_reading(status)
+    if reading is not None:
+        measured_at, drift = reading
+        record_clock_drift(hass, device_id, drift, measured_at)
+    get_command_tracker(hass).async_handle_status(device_id, status)
+    async_dispatcher_send(hass, SIGNAL_STATUS_UPDATED.format(device_id), status)
+    async_dispatcher_send(hass, SIGNAL_FLEET_UPDATED, device_id)
+    return status
+
+
+async def _fetch_device_status(
+    session: aiohttp.ClientSession,
+    device_id: str,
+    access_token: str
+) -> dict:
+    """Fetch device status from the SmartThings REST API."""
     url = f"{SMARTTHINGS_API_BASE}/devices/{device_id}/status"
     
     headers = {
@@ -77,8 +155,6 @@ async def get_device_status(
         "Accept": "application/json"
     }
     
-    session = async_get_clientsession(hass)
-    
     try:
         async with session.get(url, headers=headers) as response:
             if response.status != 200:
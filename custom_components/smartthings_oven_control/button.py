@@ -1,16 +1,21 @@
 """Button entities for SmartThings Oven Control."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
-from datetime import datetime
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .clock_sync import async_sync_oven_clock
+from .command_guard import is_clock_sync_redundant, is_running_program, is_start_redundant
+from .command_tracker import get_command_tracker
+from .const import DOMAIN, SIGNAL_COOK_STARTED
 from .oven_entity import SmartThingsOvenEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -71,9 +76,14 @@ class OvenStartButton(SmartThingsOvenEntity, ButtonEntity):
         
         self._attr_unique_id = f"{device_id}_oven_start"
         self._attr_name = "Start Cooking"
+        self._attr_extra_state_attributes = {"skipped_commands": 0}
 
     async def async_press(self) -> None:
         """Start oven with stored settings."""
+        await self.async_start_cooking()
+
+    async def async_start_cooking(self, wait_for_confirmation: bool = False) -> None:
+        """Start oven with stored settings, optionally until the oven confirms."""
         try:
             # Get current values from the coordinator data
             coordinator = self.hass.data[DOMAIN][self._config_entry.entry_id]
@@ -88,23 +98,67 @@ class OvenStartButton(SmartThingsOvenEntity, ButtonEntity):
             api_cook_time = int(cook_time * 60)  # Convert minutes to seconds
             api_temperature = int(temperature)
             
-            # Execute REST command to start oven
-            from .api_client import execute_oven_command
-            await execute_oven_command(
-                self.hass,
+            if is_start_redundant(
+                self.hass, self._device_id, mode, api_cook_time, api_temperature
+            ):
+                self._record_skip()
+                _LOGGER.info("Oven already running %s at %s°F for %s min, skipping start",
+                            mode, temperature, cook_time)
+                return
+            
+            # Track the command so the next matching status confirms it
+            tracker = get_command_tracker(self.hass)
+            pending = tracker.track(
                 self._device_id,
-                self._access_token, 
-                "ovenOperatingState",
-                "start",
-                [mode, api_cook_time, api_temperature]
+                self._access_token,
+                f"start {mode}",
+                lambda status: is_running_program(status, mode, api_temperature),
             )
+            pending.future.add_done_callback(self._handle_confirmation)
+            
+            # Execute REST command to start oven
+            from .api_client import execute_oven_command
+            try:
+                await execute_oven_command(
+                    self.hass,
+                    self._device_id,
+                    self._access_token, 
+                    "ovenOperatingState",
+                    "start",
+                    [mode, api_cook_time, api_temperature]
+                )
+            except Exception:
+                tracker.discard(pending)
+                raise
             
             _LOGGER.info("Oven started with mode: %s, temp: %s°F, time: %s min", 
                         mode, temperature, cook_time)
+            async_dispatcher_send(
+                self.hass, SIGNAL_COOK_STARTED.format(self._device_id),
+                mode, api_cook_time, api_temperature,
+            )
+            
+            if wait_for_confirmation:
+                try:
+                    latency = await tracker.wait_for_confirmation(pending)
+                except asyncio.TimeoutError as e:
+                    raise HomeAssistantError("Oven did not confirm the start command") from e
+                _LOGGER.info("Oven confirmed start after %.1f s", latency)
         except Exception as e:
             _LOGGER.error("Failed to start oven: %s", e)
             raise
 
+    @callback
+    def _handle_confirmation(self, future: asyncio.Future) -> None:
+        """Publish the time the oven took to confirm the last start."""
+        if future.cancelled() or future.exception() is not None:
+            return
+        attributes = dict(self._attr_extra_state_attributes or {})
+        attributes["confirmation_latency"] = round(future.result(), 1)
+        self._attr_extra_state_attributes = attributes
+        if self.hass is not None:
+            self.async_write_ha_state()
+
 
 class OvenSyncTimeButton(SmartThingsOvenEntity, ButtonEntity):
     """Button entity for syncing oven time."""
@@ -126,21 +180,18 @@ class OvenSyncTimeButton(SmartThingsOvenEntity, ButtonEntity):
         
         self._attr_unique_id = f"{device_id}_oven_sync_time"
         self._attr_name = "Sync Time"
+        self._attr_extra_state_attributes = {"skipped_commands": 0}
 
     async def async_press(self) -> None:
         """Sync oven time with HA time."""
         try:
-            current_time = datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
+            if is_clock_sync_redundant(self.hass, self._device_id):
+                self._record_skip()
+                _LOGGER.info("Oven clock already within tolerance, skipping time sync")
+                return
             
-            # Execute REST command to sync time
-            from .api_client import execute_oven_command
-            await execute_oven_command(
-                self.hass,
-                self._device_id,
-                self._access_token,
-                "execute", 
-                "execute",
-                ["/configuration/vs/0", {"x.com.samsung.da.currentTime": current_time}]
+            current_time = await async_sync_oven_clock(
+                self.hass, self._device_id, self._access_token
             )
             
             _LOGGER.info("Oven time synced to: %s", current_time)
@@ -0,0 +1,389 @@
+"""Record and replay SmartThings API traffic."""
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import aiohttp
+import voluptuous as vol
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
+
+from .const import (
+    DOMAIN,
+    MAX_CASSETTE_INTERACTIONS,
+    PRIORITY_BACKGROUND,
+    SMARTTHINGS_API_BASE,
+    TRAFFIC_MODE_OFF,
+    TRAFFIC_MODE_RECORD,
+    TRAFFIC_MODE_REPLAY,
+    TRAFFIC_MODE_SIMULATE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+
+def _relative_path(url: str) -> str:
+    """Strip the API base so cassettes do not depend on the host."""
+    if url.startswith(SMARTTHINGS_API_BASE):
+        return url[len(SMARTTHINGS_API_BASE):]
+    return url
+
+
+def _request_key(method: str, path: str, payload: Any) -> str:
+    """Return the key replayed responses are matched on."""
+    body = json.dumps(payload, sort_keys=True) if payload is not None else ""
+    return f"{method} {path} {body}"
+
+
+class Cassette:
+    """Recorded request/response pairs with their timings.
+
+    Each interaction is stored compactly as ``t`` (offset from the start of
+    the recording), ``m`` (method), ``p`` (path below the API base), ``q``
+    (request JSON), ``s`` (status), ``b`` (response body) and ``d`` (request
+    duration), all times in seconds. Authorization headers are never stored.
+    Recording stops once ``max_interactions`` have been captured.
+    """
+
+    def __init__(
+        self,
+        interactions: list[dict] | None = None,
+        max_interactions: int = MAX_CASSETTE_INTERACTIONS,
+    ) -> None:
+        """Initialize the cassette."""
+        self.interactions: list[dict] = interactions or []
+        self.max_interactions = max_interactions
+        self._started = time.monotonic()
+
+    @property
+    def full(self) -> bool:
+        """Return True once no more interactions will be recorded."""
+        return len(self.interactions) >= self.max_interactions
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        payload: Any,
+        status: int,
+        body: str,
+        started: float,
+        duration: float,
+    ) -> None:
+        """Append an interaction unless the cassette is full."""
+        if self.full:
+            return
+        try:
+            stored_body: Any = json.loads(body)
+        except ValueError:
+            stored_body = body
+        self.interactions.append({
+            "t": round(started - self._started, 3),
+            "m": method,
+            "p": _relative_path(url),
+            "q": payload,
+            "s": status,
+            "b": stored_body,
+            "d": round(duration, 3),
+        })
+        if self.full:
+            _LOGGER.warning("Cassette reached %s interactions; recording stopped",
+                           self.max_interactions)
+
+    @property
+    def latencies(self) -> list[float]:
+        """Return the recorded request durations."""
+        return [interaction["d"] for interaction in self.interactions]
+
+    def save(self, path: Path) -> None:
+        """Write the cassette as gzipped JSON."""
+        data = {"version": CASSETTE_VERSION, "interactions": self.interactions}
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: Path) -> Cassette:
+        """Read a cassette written by save()."""
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+        return cls(data["interactions"])
+
+
+class CassetteResponse:
+    """Minimal stand-in for an aiohttp response backed by recorded data."""
+
+    def __init__(self, status: int, body: Any) -> None:
+        """Initialize the response."""
+        self.status = status
+        self._body = body
+
+    async def text(self) -> str:
+        """Return the body as text."""
+        if isinstance(self._body, str):
+            return self._body
+        return json.dumps(self._body)
+
+    async def json(self) -> Any:
+        """Return the body as JSON."""
+        if isinstance(self._body, str):
+            return json.loads(self._body)
+        return self._body
+
+    async def __aenter__(self) -> CassetteResponse:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class PendingResponse:
+    """Async context manager resolving to a CassetteResponse."""
+
+    def __init__(self, factory: Callable[[], Awaitable[CassetteResponse]]) -> None:
+        self._factory = factory
+
+    async def __aenter__(self) -> CassetteResponse:
+        return await self._factory()
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+
+class RecordingSession:
+    """Session wrapper that records every request made through it."""
+
+    def __init__(self, session: aiohttp.ClientSession, cassette: Cassette) -> None:
+        """Initialize the recording session."""
+        self._session = session
+        self._cassette = cassette
+
+    def get(self, url: str, **kwargs: Any) -> PendingResponse:
+        """Perform and record a GET request."""
+        return PendingResponse(lambda: self._request("GET", url, **kwargs))
+
+    def post(self, url: str, **kwargs: Any) -> PendingResponse:
+        """Perform and record a POST request."""
+        return PendingResponse(lambda: self._request("POST", url, **kwargs))
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> CassetteResponse:
+        started = time.monotonic()
+        async with self._session.request(method, url, **kwargs) as response:
+            body = await response.text()
+            status = response.status
+        self._cassette.record(
+            method, url, kwargs.get("json"), status, body,
+            started, time.monotonic() - started,
+        )
+        try:
+            return CassetteResponse(status, json.loads(body))
+        except ValueError:
+            return CassetteResponse(status, body)
+
+
+class ReplaySession:
+    """Local stub serving recorded responses instead of the SmartThings cloud.
+
+    Responses are matched on method, path and request body, falling back to
+    method and path alone for bodies that embed a timestamp such as the clock
+    sync. They are served in recorded order; once a request's recordings run
+    out the last one is repeated, so status polling can outlast the recording.
+    Each response is delayed by its recorded duration divided by ``speed``
+    (0 disables delays).
+    """
+
+    def __init__(self, cassette: Cassette, speed: float = 1.0) -> None:
+        """Initialize the replay session."""
+        self._speed = speed
+        self._responses: dict[str, list[dict]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        for interaction in cassette.interactions:
+            key = _request_key(interaction["m"], interaction["p"], interaction["q"])
+            self._responses[key].append(interaction)
+            fallback = _request_key(interaction["m"], interaction["p"], None)
+            if fallback != key:
+                self._responses[fallback].append(interaction)
+
+    def get(self, url: str, **kwargs: Any) -> PendingResponse:
+        """Serve a recorded GET response."""
+        return PendingResponse(lambda: self._respond("GET", url, kwargs.get("json")))
+
+    def post(self, url: str, **kwargs: Any) -> PendingResponse:
+        """Serve a recorded POST response."""
+        return PendingResponse(lambda: self._respond("POST", url, kwargs.get("json")))
+
+    async def _respond(self, method: str, url: str, payload: Any) -> CassetteResponse:
+        key = _request_key(method, _relative_path(url), payload)
+        if key not in self._responses:
+            key = _request_key(method, _relative_path(url), None)
+        recorded = self._responses.get(key)
+        if not recorded:
+            _LOGGER.warning("No recorded response for %s", key)
+            return CassetteResponse(404, {"error": "not recorded"})
+
+        index = min(self._served[key], len(recorded) - 1)
+        self._served[key] += 1
+        interaction = recorded[index]
+        if self._speed > 0:
+            await asyncio.sleep(interaction["d"] / self._speed)
+        return CassetteResponse(interaction["s"], interaction["b"])
+
+
+async def async_replay_load(
+    cassette: Cassette,
+    send: Callable[[str, str, Any], Awaitable[Any]],
+    speed: float = 1.0,
+) -> list[float]:
+    """Re-issue recorded requests at their original offsets.
+
+    ``send`` is called with the method, path and request JSON of every
+    interaction, spaced by the recorded offsets divided by ``speed``. Returns
+    the observed duration of each call, in recorded order.
+    """
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def _issue(interaction: dict) -> float:
+        if speed > 0:
+            await asyncio.sleep(max(start + interaction["t"] / speed - loop.time(), 0))
+        issued = loop.time()
+        await send(interaction["m"], interaction["p"], interaction["q"])
+        return loop.time() - issued
+
+    return list(await asyncio.gather(
+        *(_issue(interaction) for interaction in cassette.interactions)
+    ))
+
+
+def wrap_session(
+    hass: HomeAssistant, session: aiohttp.ClientSession
+) -> Any:
+    """Return the session requests should use in the current traffic mode."""
+    traffic = hass.data.get(DOMAIN, {}).get("traffic")
+    if traffic is None:
+        return session
+    if traffic["mode"] == TRAFFIC_MODE_RECORD:
+        return RecordingSession(session, traffic["cassette"])
+    return traffic["session"]
+
+
+def cassette_filename(value: Any) -> str:
+    """Validate a cassette filename inside the HA config directory."""
+    filename = str(value)
+    if not filename or filename.startswith(".") or "/" in filename or "\\" in filename:
+        raise vol.Invalid("Filename must be a plain file name in the config directory")
+    return filename
+
+
+async def async_save_recording(hass: HomeAssistant) -> None:
+    """Write the cassette being recorded, if any, without stopping recording."""
+    traffic = hass.data.get(DOMAIN, {}).get("traffic")
+    if traffic is None or traffic["mode"] != TRAFFIC_MODE_RECORD:
+        return
+    cassette = traffic["cassette"]
+    await hass.async_add_executor_job(cassette.save, traffic["path"])
+    _LOGGER.info("Saved %s recorded interactions to %s",
+                len(cassette.interactions), traffic["path"])
+
+
+async def async_set_traffic_mode(
+    hass: HomeAssistant, mode: str, filename: str, speed: float = 1.0
+) -> None:
+    """Switch between live, recording and replayed API traffic.
+
+    Leaving record mode writes the cassette to ``filename`` in the HA config
+    directory, as do unloading the integration and stopping HA while
+    recording; entering replay mode loads it from there. Simulate mode serves
+    every device from virtual ovens running ``speed`` times faster than real
+    time.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    await async_save_recording(hass)
+    previous = domain_data.pop("traffic", None)
+    if previous is not None and previous.get("unsub_stop") is not None:
+        previous["unsub_stop"]()
+
+    path = Path(hass.config.path(filename))
+    if mode == TRAFFIC_MODE_RECORD:
+        traffic = {"mode": mode, "path": path, "cassette": Cassette()}
+
+        async def _async_save_on_stop(_event: Event) -> None:
+            traffic["unsub_stop"] = None
+            await async_save_recording(hass)
+
+        traffic["unsub_stop"] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_save_on_stop
+        )
+        domain_data["traffic"] = traffic
+    elif mode == TRAFFIC_MODE_REPLAY:
+        cassette = await hass.async_add_executor_job(Cassette.load, path)
+        domain_data["traffic"] = {
+            "mode": mode,
+            "path": path,
+            "session": ReplaySession(cassette, speed),
+        }
+    elif mode == TRAFFIC_MODE_SIMULATE:
+        from .simulator import OvenSimulator, SimulatorSession
+        domain_data["traffic"] = {
+            "mode": mode,
+            "session": SimulatorSession(OvenSimulator(time_scale=speed or 1.0)),
+        }
+    elif mode != TRAFFIC_MODE_OFF:
+        raise ValueError(f"Unknown traffic mode: {mode}")
+    _LOGGER.info("SmartThings API traffic mode: %s", mode)
+
+
+async def async_run_replay_load(
+    hass: HomeAssistant, filename: str, speed: float = 1.0
+) -> dict[str, float]:
+    """Re-issue a cassette's requests through the dispatchers and report latency.
+
+    Only allowed in replay or simulate mode, so recorded commands never reach
+    real ovens. Requests keep their recorded lanes and account routing.
+    """
+    traffic = hass.data.get(DOMAIN, {}).get("traffic")
+    if traffic is None or traffic["mode"] not in (TRAFFIC_MODE_REPLAY, TRAFFIC_MODE_SIMULATE):
+        raise ValueError("Load replay requires replay or simulate traffic mode")
+
+    from .accounts import account_for_device, get_account_session
+    from .dispatch import command_priority, get_dispatcher
+
+    cassette = await hass.async_add_executor_job(Cassette.load, Path(hass.config.path(filename)))
+
+    async def _send(method: str, path: str, payload: Any) -> int:
+        device_id = path.split("/")[2] if path.startswith("/devices/") else ""
+        account_id = account_for_device(hass, device_id)
+        priority = PRIORITY_BACKGROUND
+        if method == "POST" and payload:
+            priority = command_priority(payload[0].get("capability"), payload[0].get("command"))
+
+        async def _request() -> int:
+            session = get_account_session(hass, account_id)
+            request = session.post if method == "POST" else session.get
+            async with request(f"{SMARTTHINGS_API_BASE}{path}", json=payload) as response:
+                return response.status
+
+        return await get_dispatcher(hass, account_id).submit(device_id, priority, _request)
+
+    durations = sorted(await async_replay_load(cassette, _send, speed))
+    if not durations:
+        return {"requests": 0}
+    summary = {
+        "requests": len(durations),
+        "p50": durations[len(durations) // 2],
+        "p95": durations[min(int(len(durations) * 0.95), len(durations) - 1)],
+        "max": durations[-1],
+    }
+    _LOGGER.info("Replayed load: %s", summary)
+    return summary
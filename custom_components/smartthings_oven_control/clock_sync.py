@@ -0,0 +1,221 @@
+"""Oven clock drift monitoring and synchronization."""
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timedelta
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .command_guard import record_clock_drift, status_attribute
+from .const import (
+    CLOCK_CHECK_INTERVAL,
+    CLOCK_CHECK_MAX_INTERVAL,
+    CLOCK_CHECK_MIN_INTERVAL,
+    CLOCK_DRIFT_SAMPLES,
+    CLOCK_RESYNC_THRESHOLD,
+    DOMAIN,
+    OVEN_CLOCK_ATTRIBUTE,
+    OVEN_CLOCK_FORMAT,
+    PRIORITY_BACKGROUND,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def oven_clock_reading(status: dict) -> tuple[datetime, float] | None:
+    """Return when the oven reported its clock and how far it was ahead then.
+
+    The clock is part of the result of the last ``execute`` call, which is not
+    refreshed by a status fetch, so it is compared with HA local time at the
+    attribute's own timestamp. The oven keeps naive local wall-clock time, so
+    a DST change shows up as a one hour drift.
+    """
+    attribute = status_attribute(status, "execute", "data")
+    data = attribute.get("value")
+    if not isinstance(data, dict):
+        return None
+    payload = data.get("payload", data)
+    raw_time = payload.get(OVEN_CLOCK_ATTRIBUTE) if isinstance(payload, dict) else None
+    if not raw_time:
+        return None
+
+    try:
+        oven_time = datetime.strptime(raw_time[:19], OVEN_CLOCK_FORMAT)
+        measured_at = dt_util.parse_datetime(attribute["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        _LOGGER.debug("Unparseable oven clock reading: %s", attribute)
+        return None
+    if measured_at is None or measured_at.tzinfo is None:
+        return None
+
+    local_time = dt_util.as_local(measured_at).replace(tzinfo=None)
+    return measured_at, (oven_time - local_time).total_seconds()
+
+
+def seconds_until_utcoffset_change(now: datetime, horizon: float) -> float | None:
+    """Return seconds until HA's UTC offset next changes within the horizon.
+
+    Offset changes (DST switches) are at least months apart, so comparing the
+    offset at both ends of a horizon of at most a day finds any change, which
+    is then located to the minute by bisection. The arithmetic is done in
+    UTC, since adding to an aware local time moves its wall clock instead.
+    """
+    now_utc = dt_util.as_utc(now)
+    start_offset = dt_util.as_local(now_utc).utcoffset()
+    end = dt_util.as_local(now_utc + timedelta(seconds=horizon))
+    if end.utcoffset() == start_offset:
+        return None
+
+    low, high = 0.0, horizon
+    while high - low > 60:
+        middle = (low + high) / 2
+        probe = dt_util.as_local(now_utc + timedelta(seconds=middle))
+        if probe.utcoffset() == start_offset:
+            low = middle
+        else:
+            high = middle
+    return high
+
+
+async def async_sync_oven_clock(
+    hass: HomeAssistant,
+    device_id: str,
+    access_token: str,
+    priority: int | None = None,
+) -> str:
+    """Set the oven clock to HA local time and return the value sent."""
+    current_time = dt_util.now().strftime(OVEN_CLOCK_FORMAT)
+
+    from .api_client import execute_oven_command
+    await execute_oven_command(
+        hass,
+        device_id,
+        access_token,
+        "execute",
+        "execute",
+        ["/configuration/vs/0", {OVEN_CLOCK_ATTRIBUTE: current_time}],
+        priority=priority,
+    )
+
+    record_clock_drift(hass, device_id, 0.0)
+    monitor = hass.data.get(DOMAIN, {}).get("clock_monitors", {}).get(device_id)
+    if monitor is not None:
+        monitor.reset_baseline()
+    return current_time
+
+
+class ClockDriftMonitor:
+    """Track an oven's clock drift and re-sync it on an adaptive schedule.
+
+    Drift samples since the last sync are fitted to a drift rate, and the next
+    check is scheduled for roughly when the drift is expected to reach half of
+    the re-sync threshold. Ovens with a stable clock are therefore checked
+    rarely, while fast-drifting ones are checked and synced more often.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: str, access_token: str) -> None:
+        """Initialize the monitor."""
+        self._hass = hass
+        self._device_id = device_id
+        self._access_token = access_token
+        self._samples: list[tuple[float, float]] = []
+        self._last_rate: float | None = None
+        self._last_reading: datetime | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+        self._stopped = False
+
+    @property
+    def drift_rate(self) -> float | None:
+        """Return the measured drift rate in seconds per second."""
+        if len(self._samples) < 2:
+            return self._last_rate
+        count = len(self._samples)
+        mean_t = sum(t for t, _ in self._samples) / count
+        mean_d = sum(d for _, d in self._samples) / count
+        variance = sum((t - mean_t) ** 2 for t, _ in self._samples)
+        if variance == 0:
+            return self._last_rate
+        covariance = sum((t - mean_t) * (d - mean_d) for t, d in self._samples)
+        return covariance / variance
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first drift check."""
+        monitors = self._hass.data.setdefault(DOMAIN, {}).setdefault("clock_monitors", {})
+        monitors[self._device_id] = self
+        self._schedule(CLOCK_CHECK_MIN_INTERVAL)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel any scheduled drift check."""
+        self._stopped = True
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        monitors = self._hass.data.get(DOMAIN, {}).get("clock_monitors", {})
+        if monitors.get(self._device_id) is self:
+            monitors.pop(self._device_id)
+
+    def reset_baseline(self) -> None:
+        """Start a new drift baseline after the clock has been set."""
+        self._last_rate = self.drift_rate
+        self._last_reading = dt_util.utcnow()
+        self._samples = [(self._last_reading.timestamp(), 0.0)]
+
+    def next_interval(self, drift: float) -> float:
+        """Return the delay before the next check given the current drift."""
+        rate = self.drift_rate
+        if not rate:
+            return CLOCK_CHECK_INTERVAL
+        margin = max(CLOCK_RESYNC_THRESHOLD / 2 - abs(drift), 0)
+        interval = margin / abs(rate)
+        return min(max(interval, CLOCK_CHECK_MIN_INTERVAL), CLOCK_CHECK_MAX_INTERVAL)
+
+    @callback
+    def _schedule(self, delay: float) -> None:
+        """Schedule the next drift check, no later than the next DST switch."""
+        if self._stopped:
+            return
+        offset_change = seconds_until_utcoffset_change(dt_util.now(), delay)
+        if offset_change is not None:
+            # Check shortly after the switch so the oven is re-synced promptly
+            delay = offset_change + 60
+        self._unsub = async_call_later(self._hass, delay, self._async_check)
+
+    async def _async_check(self, _now: datetime) -> None:
+        """Measure drift and re-sync the clock if it passed the threshold."""
+        self._unsub = None
+        delay = CLOCK_CHECK_INTERVAL
+        try:
+            from .api_client import get_device_status
+            status = await get_device_status(
+                self._hass, self._device_id, self._access_token
+            )
+            reading = oven_clock_reading(status)
+            if reading is None:
+                _LOGGER.debug("Oven %s does not report its clock", self._device_id)
+            elif self._last_reading is not None and reading[0] <= self._last_reading:
+                # The status still carries the reading from the last check
+                # or sync, which says nothing about the drift since
+                _LOGGER.debug("Oven %s reported no new clock reading", self._device_id)
+            elif abs(reading[1]) > CLOCK_RESYNC_THRESHOLD:
+                _LOGGER.info("Oven %s clock drifted %.0f s, syncing",
+                            self._device_id, reading[1])
+                await async_sync_oven_clock(
+                    self._hass, self._device_id, self._access_token,
+                    priority=PRIORITY_BACKGROUND,
+                )
+                delay = self.next_interval(0.0)
+            else:
+                self._last_reading, drift = reading
+                self._samples.append((self._last_reading.timestamp(), drift))
+                del self._samples[:-CLOCK_DRIFT_SAMPLES]
+                delay = self.next_interval(drift)
+                _LOGGER.debug("Oven %s clock drift %.1f s, next check in %.0f s",
+                             self._device_id, drift, delay)
+        except Exception as e:  # pylint: disable=broad-except
+            _LOGGER.warning("Clock drift check failed for %s: %s", self._device_id, e)
+        finally:
+            self._schedule(delay)
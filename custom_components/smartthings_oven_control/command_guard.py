@@ -0,0 +1,179 @@
+"""State-aware suppression of redundant oven commands."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CLOCK_DRIFT_MAX_AGE,
+    CLOCK_SYNC_TOLERANCE,
+    DOMAIN,
+    START_STATUS_MAX_AGE,
+    STATUS_MAX_AGE,
+    TEMPERATURE_RANGES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _device_state(hass: HomeAssistant, device_id: str) -> dict[str, Any]:
+    """Return the cached state for a device."""
+    states = hass.data.setdefault(DOMAIN, {}).setdefault("device_state", {})
+    return states.setdefault(device_id, {})
+
+
+def record_status(hass: HomeAssistant, device_id: str, status: dict) -> None:
+    """Store the latest device status reported by SmartThings."""
+    state = _device_state(hass, device_id)
+    state["status"] = status
+    state["status_time"] = time.monotonic()
+    state["status_wall_time"] = time.time()
+    state["available"] = True
+
+
+def record_command_sent(hass: HomeAssistant, device_id: str) -> None:
+    """Note that a command was sent, so older statuses no longer apply."""
+    _device_state(hass, device_id)["command_time"] = time.monotonic()
+
+
+def record_status_failure(hass: HomeAssistant, device_id: str) -> None:
+    """Mark a device unavailable after a failed status fetch."""
+    _device_state(hass, device_id)["available"] = False
+
+
+def get_status_info(hass: HomeAssistant, device_id: str) -> dict[str, Any]:
+    """Return the last status with its availability and wall-clock time."""
+    state = _device_state(hass, device_id)
+    return {
+        "status": state.get("status"),
+        "available": state.get("available"),
+        "last_update": state.get("status_wall_time"),
+    }
+
+
+def get_cached_status(
+    hass: HomeAssistant, device_id: str, max_age: float = STATUS_MAX_AGE
+) -> dict | None:
+    """Return the cached device status if it is recent enough.
+
+    A status fetched before the last command sent to the device is never
+    returned, since it may not reflect that command yet.
+    """
+    state = _device_state(hass, device_id)
+    status = state.get("status")
+    if status is None or time.monotonic() - state["status_time"] > max_age:
+        return None
+    if state["status_time"] <= state.get("command_time", float("-inf")):
+        return None
+    return status
+
+
+def status_attribute(status: dict, capability: str, attribute: str) -> dict:
+    """Return an attribute with its value and timestamp from a status payload."""
+    return (
+        status.get("components", {})
+        .get("main", {})
+        .get(capability, {})
+        .get(attribute, {})
+    )
+
+
+def status_value(status: dict, capability: str, attribute: str) -> Any:
+    """Return an attribute value from a SmartThings status payload."""
+    return status_attribute(status, capability, attribute).get("value")
+
+
+def record_clock_drift(
+    hass: HomeAssistant,
+    device_id: str,
+    drift: float,
+    measured_at: datetime | None = None,
+) -> None:
+    """Store a measured oven clock offset from HA time in seconds.
+
+    ``measured_at`` is when the oven reported the clock reading, defaulting
+    to now. A reading that is not newer than the stored one is ignored.
+    """
+    measured_at = measured_at or dt_util.utcnow()
+    state = _device_state(hass, device_id)
+    if "clock_drift_measured_at" in state and measured_at <= state["clock_drift_measured_at"]:
+        return
+    state["clock_drift"] = drift
+    state["clock_drift_measured_at"] = measured_at
+    state["clock_drift_utcoffset"] = dt_util.as_local(measured_at).utcoffset()
+
+
+def estimated_clock_drift(hass: HomeAssistant, device_id: str) -> float | None:
+    """Return the estimated oven clock offset, or None if unknown.
+
+    The last measurement is projected forward with the drift rate measured by
+    the device's clock monitor. It is discarded once it is too old or when
+    HA's UTC offset changed since (e.g. a DST switch), because the oven's
+    naive local clock does not follow such changes.
+    """
+    state = _device_state(hass, device_id)
+    if "clock_drift" not in state:
+        return None
+    if state.get("clock_drift_utcoffset") != dt_util.now().utcoffset():
+        return None
+    elapsed = (dt_util.utcnow() - state["clock_drift_measured_at"]).total_seconds()
+    if elapsed > CLOCK_DRIFT_MAX_AGE:
+        return None
+
+    monitor = hass.data.get(DOMAIN, {}).get("clock_monitors", {}).get(device_id)
+    rate = monitor.drift_rate if monitor is not None else None
+    return state["clock_drift"] + (rate or 0.0) * elapsed
+
+
+def is_running_program(status: dict, mode: str, temperature: int) -> bool:
+    """Return True if a status shows the oven running a mode and setpoint.
+
+    Modes without a temperature setting (Broil, SelfClean, SteamClean) report
+    no meaningful setpoint, so only the mode is compared for them.
+    """
+    if status_value(status, "ovenOperatingState", "machineState") != "running":
+        return False
+    if status_value(status, "ovenMode", "ovenMode") != mode:
+        return False
+    if TEMPERATURE_RANGES.get(mode) == (0, 0):
+        return True
+    try:
+        return int(status_value(status, "ovenSetpoint", "ovenSetpoint")) == temperature
+    except (TypeError, ValueError):
+        return False
+
+
+def is_start_redundant(
+    hass: HomeAssistant,
+    device_id: str,
+    mode: str,
+    cook_time: int,
+    temperature: int,
+) -> bool:
+    """Return True if the oven is already running the requested program.
+
+    Only a status from the last few seconds is trusted, so a program that
+    was stopped at the oven's panel meanwhile is not mistaken for running.
+    """
+    status = get_cached_status(hass, device_id, START_STATUS_MAX_AGE)
+    if status is None or not is_running_program(status, mode, temperature):
+        return False
+
+    operation_time = status_value(status, "ovenOperatingState", "operationTime")
+    try:
+        return int(operation_time) == cook_time
+    except (TypeError, ValueError):
+        return False
+
+
+def is_clock_sync_redundant(hass: HomeAssistant, device_id: str) -> bool:
+    """Return True if the oven clock is already within tolerance of HA time."""
+    drift = estimated_clock_drift(hass, device_id)
+    if drift is None:
+        return False
+    return abs(drift) <= CLOCK_SYNC_TOLERANCE
@@ -0,0 +1,191 @@
+"""Track when the oven confirms commands accepted by SmartThings."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import (
+    CONFIRMATION_LATENCY_SAMPLES,
+    CONFIRMATION_POLL_INTERVAL,
+    CONFIRMATION_TIMEOUT,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+StatusPredicate = Callable[[dict], bool]
+
+
+class PendingCommand:
+    """A command waiting for the oven to report the requested state."""
+
+    def __init__(self, device_id: str, description: str, predicate: StatusPredicate) -> None:
+        """Initialize the pending command."""
+        self.device_id = device_id
+        self.description = description
+        self.predicate = predicate
+        self.sent_at = time.monotonic()
+        self.latency: float | None = None
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    @property
+    def confirmed(self) -> bool:
+        """Return True once the oven reported the requested state."""
+        return self.future.done() and not self.future.cancelled()
+
+
+class CommandTracker:
+    """Resolve pending commands from a single shared status stream.
+
+    Every status payload fetched for a device is offered to that device's
+    pending commands. While any command is pending, one status fetch per
+    device runs every few seconds no matter how many commands are waiting on
+    it. State changes pushed to the SmartThings integration's entities for
+    the same device wake that fetch early, so confirmations arrive as soon as
+    SmartThings reports the change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._pending: dict[str, list[PendingCommand]] = {}
+        self._pollers: dict[str, asyncio.Task] = {}
+        self._tokens: dict[str, str] = {}
+        self._wake: dict[str, asyncio.Event] = {}
+        self.latencies: deque[float] = deque(maxlen=CONFIRMATION_LATENCY_SAMPLES)
+
+    def track(
+        self,
+        device_id: str,
+        access_token: str,
+        description: str,
+        predicate: StatusPredicate,
+    ) -> PendingCommand:
+        """Register a command and start watching the device's status."""
+        pending = PendingCommand(device_id, description, predicate)
+        self._pending.setdefault(device_id, []).append(pending)
+        self._tokens[device_id] = access_token
+        self._hass.loop.call_later(CONFIRMATION_TIMEOUT, self._expire, pending)
+
+        if device_id not in self._pollers:
+            self._pollers[device_id] = asyncio.create_task(self._async_poll(device_id))
+        return pending
+
+    def discard(self, pending: PendingCommand) -> None:
+        """Stop tracking a command, e.g. when dispatching it failed."""
+        self._remove(pending)
+        if not pending.future.done():
+            pending.future.cancel()
+
+    async def wait_for_confirmation(
+        self, pending: PendingCommand, timeout: float = CONFIRMATION_TIMEOUT
+    ) -> float:
+        """Wait until the command is confirmed and return its latency."""
+        remaining = max(timeout - (time.monotonic() - pending.sent_at), 0)
+        return await asyncio.wait_for(asyncio.shield(pending.future), remaining)
+
+    def async_handle_status(self, device_id: str, status: dict) -> None:
+        """Resolve pending commands that the given status confirms."""
+        for pending in list(self._pending.get(device_id, ())):
+            try:
+                matched = pending.predicate(status)
+            except Exception as e:  # pylint: disable=broad-except
+                _LOGGER.debug("Confirmation check failed for %s: %s", pending.description, e)
+                continue
+            if not matched:
+                continue
+
+            pending.latency = time.monotonic() - pending.sent_at
+            self.latencies.append(pending.latency)
+            self._remove(pending)
+            if not pending.future.done():
+                pending.future.set_result(pending.latency)
+            _LOGGER.debug("Oven %s confirmed %s after %.1f s",
+                         device_id, pending.description, pending.latency)
+
+    def _remove(self, pending: PendingCommand) -> None:
+        """Remove a command from the pending list."""
+        device_pending = self._pending.get(pending.device_id, [])
+        if pending in device_pending:
+            device_pending.remove(pending)
+        if not device_pending:
+            self._pending.pop(pending.device_id, None)
+
+    def _expire(self, pending: PendingCommand) -> None:
+        """Give up on a command the oven never confirmed."""
+        if pending.future.done():
+            return
+        self._remove(pending)
+        pending.future.set_exception(
+            asyncio.TimeoutError(f"Oven did not confirm {pending.description}")
+        )
+        # Nobody may be awaiting the result; mark the exception retrieved
+        pending.future.exception()
+        _LOGGER.warning("Oven %s did not confirm %s within %s s",
+                       pending.device_id, pending.description, CONFIRMATION_TIMEOUT)
+
+    def _smartthings_entity_ids(self, device_id: str) -> list[str]:
+        """Return the SmartThings integration's entities for a device."""
+        device = dr.async_get(self._hass).async_get_device(
+            identifiers={("smartthings", device_id)}
+        )
+        if device is None:
+            return []
+        entity_registry = er.async_get(self._hass)
+        return [
+            entry.entity_id
+            for entry in er.async_entries_for_device(entity_registry, device.id)
+        ]
+
+    @callback
+    def _async_track_push(self, device_id: str, wake: asyncio.Event) -> CALLBACK_TYPE | None:
+        """Wake the status fetch when SmartThings pushes a state change."""
+        entity_ids = self._smartthings_entity_ids(device_id)
+        if not entity_ids:
+            return None
+
+        @callback
+        def _handle_push(_event: Event) -> None:
+            wake.set()
+
+        return async_track_state_change_event(self._hass, entity_ids, _handle_push)
+
+    async def _async_poll(self, device_id: str) -> None:
+        """Fetch device status while commands are pending."""
+        from .api_client import get_device_status
+        wake = self._wake.setdefault(device_id, asyncio.Event())
+        unsub_push = self._async_track_push(device_id, wake)
+        try:
+            while self._pending.get(device_id):
+                wake.clear()
+                try:
+                    await asyncio.wait_for(wake.wait(), CONFIRMATION_POLL_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+                if not self._pending.get(device_id):
+                    break
+                try:
+                    # get_device_status feeds the result back into the tracker
+                    await get_device_status(self._hass, device_id, self._tokens[device_id])
+                except Exception as e:  # pylint: disable=broad-except
+                    _LOGGER.debug("Confirmation status fetch failed for %s: %s", device_id, e)
+        finally:
+            if unsub_push is not None:
+                unsub_push()
+            self._wake.pop(device_id, None)
+            self._pollers.pop(device_id, None)
+
+
+def get_command_tracker(hass: HomeAssistant) -> CommandTracker:
+    """Return the shared command tracker."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "command_tracker" not in domain_data:
+        domain_data["command_tracker"] = CommandTracker(hass)
+    return domain_data["command_tracker"]
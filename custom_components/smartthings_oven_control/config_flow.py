@@ -9,8 +9,16 @@ from homeassistant import config_entries
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, CONF_DEVICE_ID, CONF_FRIENDLY_NAME
-from .token_utils import get_smartthings_token
+from .accounts import get_account_session
+from .const import (
+    DOMAIN,
+    CONF_ACCOUNT_ID,
+    CONF_DEVICE_ID,
+    CONF_FRIENDLY_NAME,
+    PRIORITY_BACKGROUND,
+)
+from .dispatch import get_dispatcher
+from .token_utils import get_smartthings_accounts
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,43 +30,61 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_device_id(hass: HomeAssistant, device_id: str) -> str | None:
-    """Validate device ID by testing API connectivity."""
-    access_token = await get_smartthings_token(hass)
-    if not access_token:
+async def validate_device_id(hass: HomeAssistant, device_id: str) -> tuple[str, str]:
+    """Validate device ID by testing API connectivity.
+
+    Every SmartThings account with a valid token is tried, and the device's
+    label and the ID of the account that owns it are returned.
+    """
+    accounts = await get_smartthings_accounts(hass)
+    if not accounts:
         raise ValueError("SmartThings integration not found or token expired")
     
     # Test device connectivity with a simple status request
     import aiohttp
-    from homeassistant.helpers.aiohttp_client import async_get_clientsession
     
     url = f"https://api.smartthings.com/v1/devices/{device_id}"
-    headers = {
-        "Authorization": f"Bearer {access_token}",
-        "Accept": "application/json"
-    }
     
-    session = async_get_clientsession(hass)
-    try:
+    async def _fetch_device(account_id: str, access_token: str) -> dict | None:
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json"
+        }
+        session = get_account_session(hass, account_id)
         async with session.get(url, headers=headers) as response:
-            if response.status == 404:
-                raise ValueError("Device ID not found")
+            if response.status in (403, 404):
+                # Not visible to this account
+                return None
             elif response.status != 200:
                 raise ValueError(f"SmartThings API error: {response.status}")
             
-            device_data = await response.json()
+            return await response.json()
+    
+    try:
+        for account_id, account in accounts.items():
+            # Discovery shares the background lane with polling and time sync
+            device_data = await get_dispatcher(hass, account_id).submit(
+                device_id,
+                PRIORITY_BACKGROUND,
+                lambda: _fetch_device(account_id, account["access_token"]),
+            )
+            if device_data is None:
+                continue
             
             # No longer checking for specific oven model - allow any device
             device_type = device_data.get('deviceTypeName', '')
-            _LOGGER.debug("Device type: %s", device_type)
-                
-            return device_data.get('label', 'Oven')  # Return device name for friendly naming
+            _LOGGER.debug("Device type: %s (account %s)", device_type, account["title"])
+            
+            # Return device name for friendly naming
+            return device_data.get('label', 'Oven'), account_id
     except aiohttp.ClientError as e:
         _LOGGER.error("HTTP error during device validation: %s", e)
         raise ValueError(f"HTTP error during validation: {e}")
     except Exception as e:
         _LOGGER.error("Error during device validation: %s", e)
         raise ValueError(f"Error during validation: {e}")
+    
+    raise ValueError("Device ID not found")
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -79,7 +105,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 # Validate device ID
-                device_name = await validate_device_id(self.hass, user_input[CONF_DEVICE_ID])
+                device_name, account_id = await validate_device_id(
+                    self.hass, user_input[CONF_DEVICE_ID]
+                )
                 
                 # Set unique ID to prevent duplicate entries
                 await self.async_set_unique_id(user_input[CONF_DEVICE_ID])
@@ -88,7 +116,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # Create config entry
                 return self.async_create_entry(
                     title=user_input.get(CONF_FRIENDLY_NAME, device_name),
-                    data=user_input,
+                    data={**user_input, CONF_ACCOUNT_ID: account_id},
                 )
             except ValueError as e:
                 error_msg = str(e)
@@ -48,3 +48,76 @@ MAX_COOK_TIME = 599  # 9 hours 59 minutes (9*60 + 59 = 599)
 # Config flow
 CONF_DEVICE_ID = "device_id"
 CONF_FRIENDLY_NAME = "friendly_name"
+
+# Command dispatch priority lanes (lower value is dispatched first)
+PRIORITY_SAFETY = 0  # stop/pause
+PRIORITY_USER = 1  # start and other user-initiated commands
+PRIORITY_BACKGROUND = 2  # time sync, polling, discovery
+PRIORITY_LANES = (PRIORITY_SAFETY, PRIORITY_USER, PRIORITY_BACKGROUND)
+
+# Safety commands keyed by capability
+SAFETY_COMMANDS = {
+    "ovenOperatingState": ("stop", "pause"),
+}
+
+# Maximum concurrent API requests per SmartThings account. One slot is
+# always held back for the safety lane.
+MAX_CONCURRENT_REQUESTS = 4
+
+# No-op command suppression
+STATUS_MAX_AGE = 60  # seconds a cached device status is trusted for
+START_STATUS_MAX_AGE = 10  # shorter, since the oven may be stopped at the panel
+CLOCK_SYNC_TOLERANCE = 5  # seconds of clock drift tolerated before syncing
+CLOCK_DRIFT_MAX_AGE = 3600  # seconds a clock drift measurement is trusted for
+
+# Automatic clock drift monitoring
+OVEN_CLOCK_ATTRIBUTE = "x.com.samsung.da.currentTime"
+OVEN_CLOCK_FORMAT = "%Y-%m-%dT%H:%M:%S"
+CLOCK_RESYNC_THRESHOLD = 30  # seconds of drift before an automatic sync
+CLOCK_CHECK_INTERVAL = 3600  # seconds between checks while drift rate is unknown
+CLOCK_CHECK_MIN_INTERVAL = 900
+CLOCK_CHECK_MAX_INTERVAL = 86400
+CLOCK_DRIFT_SAMPLES = 10
+
+# Command acknowledgement tracking
+CONFIRMATION_TIMEOUT = 60  # seconds to wait for the oven to report a command
+CONFIRMATION_POLL_INTERVAL = 5  # seconds between shared status fetches
+CONFIRMATION_LATENCY_SAMPLES = 50
+
+# Services
+SERVICE_START_COOKING = "start_cooking"
+SERVICE_SYNC_TIME = "sync_time"
+ATTR_WAIT_FOR_CONFIRMATION = "wait_for_confirmation"
+
+# Multi-account support
+CONF_ACCOUNT_ID = "account_id"
+ACCOUNT_REQUESTS_PER_MINUTE = 250  # request budget per SmartThings account
+
+# Traffic record/replay
+SERVICE_SET_TRAFFIC_MODE = "set_traffic_mode"
+SERVICE_REPLAY_LOAD = "replay_load"
+ATTR_MODE = "mode"
+ATTR_FILENAME = "filename"
+ATTR_SPEED = "speed"
+TRAFFIC_MODE_OFF = "off"
+TRAFFIC_MODE_RECORD = "record"
+TRAFFIC_MODE_REPLAY = "replay"
+TRAFFIC_MODE_SIMULATE = "simulate"
+TRAFFIC_MODES = [
+    TRAFFIC_MODE_OFF,
+    TRAFFIC_MODE_RECORD,
+    TRAFFIC_MODE_REPLAY,
+    TRAFFIC_MODE_SIMULATE,
+]
+DEFAULT_CASSETTE_FILENAME = "smartthings_oven_control_cassette.json.gz"
+MAX_CASSETTE_INTERACTIONS = 10000
+
+# Dispatcher signals, formatted with the device ID
+SIGNAL_STATUS_UPDATED = f"{DOMAIN}_status_updated_{{}}"
+SIGNAL_COOK_STARTED = f"{DOMAIN}_cook_started_{{}}"
+SIGNAL_FLEET_UPDATED = f"{DOMAIN}_fleet_updated"
+
+# Fleet websocket API
+FLEET_DELTA_INTERVAL = 1  # seconds deltas are batched for before sending
+FLEET_POLL_INTERVAL = 300  # seconds between status polls while dashboards subscribe
+FLEET_STALE_AFTER = 660  # seconds without a status before a row is flagged stale (two polls)
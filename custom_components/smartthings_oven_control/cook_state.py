@@ -0,0 +1,201 @@
+"""Local extrapolation of an oven's cook state between status updates."""
+from __future__ import annotations
+
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
+
+from .command_guard import status_value
+from .const import SIGNAL_COOK_STARTED, SIGNAL_STATUS_UPDATED
+from .thermal import AMBIENT_TEMP_F, cool, heat, target_temperature
+
+_LOGGER = logging.getLogger(__name__)
+
+TICK_INTERVAL = timedelta(seconds=1)
+
+
+class CookStateEstimator:
+    """Estimate remaining time, progress and temperature for one oven.
+
+    Every status payload (and every accepted start command) becomes the new
+    anchor. Between anchors the cook timer is counted down and the cavity
+    temperature is projected with the thermal model, ticking once a second on
+    the event loop only while there is something changing to report.
+    """
+
+    def __init__(self, hass: HomeAssistant, device_id: str) -> None:
+        """Initialize the estimator."""
+        self._hass = hass
+        self._device_id = device_id
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._unsub_tick: CALLBACK_TYPE | None = None
+
+        self.running = False
+        self.mode: str | None = None
+        self.setpoint = 0.0
+        self.operation_time = 0
+        self._anchor = time.monotonic()
+        self._remaining = 0.0
+        self._temperature: float | None = None
+
+    @property
+    def remaining_time(self) -> int:
+        """Return the extrapolated remaining cook time in seconds."""
+        remaining = self._remaining
+        if self.running:
+            remaining -= time.monotonic() - self._anchor
+        return max(round(remaining), 0)
+
+    @property
+    def progress(self) -> int:
+        """Return the extrapolated cook progress in percent."""
+        if not self.operation_time:
+            return 0
+        return min(max(round(100 * (1 - self.remaining_time / self.operation_time)), 0), 100)
+
+    @property
+    def temperature(self) -> float | None:
+        """Return the projected cavity temperature, if it was ever measured."""
+        if self._temperature is None:
+            return None
+        elapsed = time.monotonic() - self._anchor
+        if self.running and self.mode is not None:
+            target = target_temperature(self.mode, self.setpoint)
+            return round(heat(self._temperature, target, elapsed))
+        return round(cool(self._temperature, elapsed))
+
+    @callback
+    def async_start(self) -> None:
+        """Listen for status updates and start commands."""
+        self._unsubs = [
+            async_dispatcher_connect(
+                self._hass, SIGNAL_STATUS_UPDATED.format(self._device_id), self._handle_status
+            ),
+            async_dispatcher_connect(
+                self._hass, SIGNAL_COOK_STARTED.format(self._device_id), self._handle_cook_started
+            ),
+        ]
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening and ticking."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs = []
+        self._stop_ticking()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call update_callback whenever the estimate changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def _handle_status(self, status: dict) -> None:
+        """Snap the estimate to an authoritative status.
+
+        Values the status does not report keep their extrapolation. The
+        standard capability reports ``completionTime`` rather than
+        ``remainingTime``, so the remaining time is derived from it if needed.
+        """
+        # Carry the extrapolated values over to the new anchor
+        now = time.monotonic()
+        if self._temperature is not None:
+            self._temperature = float(self.temperature)
+        if self.running:
+            self._remaining = max(self._remaining - (now - self._anchor), 0.0)
+        self._anchor = now
+
+        machine_state = status_value(status, "ovenOperatingState", "machineState")
+        if machine_state is not None:
+            self.running = machine_state == "running"
+            if machine_state == "ready":
+                self._remaining = 0.0
+        self.mode = status_value(status, "ovenMode", "ovenMode") or self.mode
+
+        for attribute, capability, name in (
+            ("setpoint", "ovenSetpoint", "ovenSetpoint"),
+            ("operation_time", "ovenOperatingState", "operationTime"),
+            ("_remaining", "ovenOperatingState", "remainingTime"),
+            ("_temperature", "temperatureMeasurement", "temperature"),
+        ):
+            value = status_value(status, capability, name)
+            if value is not None:
+                try:
+                    setattr(self, attribute, float(value))
+                except (TypeError, ValueError):
+                    _LOGGER.debug("Ignoring non-numeric %s: %s", name, value)
+
+        completion_time = status_value(status, "ovenOperatingState", "completionTime")
+        if (
+            self.running
+            and completion_time
+            and status_value(status, "ovenOperatingState", "remainingTime") is None
+        ):
+            completion = dt_util.parse_datetime(completion_time)
+            if completion is not None and completion.tzinfo is not None:
+                self._remaining = max((completion - dt_util.utcnow()).total_seconds(), 0.0)
+
+        self._update()
+
+    @callback
+    def _handle_cook_started(self, mode: str, cook_time: int, temperature: int) -> None:
+        """Anchor the estimate on a start command the cloud accepted."""
+        if self._temperature is not None:
+            # Carry the projected temperature over to the new anchor
+            self._temperature = float(self.temperature)
+        self._anchor = time.monotonic()
+        self.running = True
+        self.mode = mode
+        self.setpoint = float(temperature)
+        self.operation_time = cook_time
+        self._remaining = float(cook_time)
+        self._update()
+
+    @callback
+    def _update(self) -> None:
+        """Notify listeners and tick only while the estimate keeps changing."""
+        cooling = self._temperature is not None and self._temperature > AMBIENT_TEMP_F + 1
+        if self.running or cooling:
+            if self._unsub_tick is None:
+                self._unsub_tick = async_track_time_interval(
+                    self._hass, self._tick, TICK_INTERVAL
+                )
+        else:
+            self._stop_ticking()
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @callback
+    def _tick(self, _now: datetime) -> None:
+        """Advance the extrapolation."""
+        if self.running and self.remaining_time == 0:
+            # The timer ran out locally; re-anchor as finished until the
+            # next status says otherwise
+            self._temperature = self.temperature
+            self._anchor = time.monotonic()
+            self._remaining = 0.0
+            self.running = False
+        elif not self.running and self.temperature is not None:
+            if self.temperature <= AMBIENT_TEMP_F + 1:
+                self._temperature = AMBIENT_TEMP_F
+        self._update()
+
+    @callback
+    def _stop_ticking(self) -> None:
+        """Cancel the once-a-second tick."""
+        if self._unsub_tick is not None:
+            self._unsub_tick()
+            self._unsub_tick = None
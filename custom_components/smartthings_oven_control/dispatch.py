@@ -0,0 +1,185 @@
+"""Prioritized command dispatch for SmartThings Oven Control."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ACCOUNT_REQUESTS_PER_MINUTE,
+    DOMAIN,
+    MAX_CONCURRENT_REQUESTS,
+    PRIORITY_BACKGROUND,
+    PRIORITY_LANES,
+    PRIORITY_SAFETY,
+    PRIORITY_USER,
+    SAFETY_COMMANDS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_ACCOUNT = "default"
+
+
+def command_priority(capability: str, command: str) -> int:
+    """Return the dispatch lane for a SmartThings command."""
+    if command in SAFETY_COMMANDS.get(capability, ()):
+        return PRIORITY_SAFETY
+    if capability == "execute":
+        # Vendor configuration writes such as the clock sync
+        return PRIORITY_BACKGROUND
+    return PRIORITY_USER
+
+
+class CommandDispatcher:
+    """Dispatch API requests for one account through priority lanes.
+
+    Requests are started in lane order (safety, user, background) whenever a
+    request slot is free. Each device has at most one request in flight,
+    except for safety requests which never wait on the device. The last free
+    slot is held back for the safety lane so a stop or pause is never stuck
+    behind slow background work. User and background requests also share a
+    per-minute budget; safety requests are never held back by it.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+        requests_per_minute: int = ACCOUNT_REQUESTS_PER_MINUTE,
+    ) -> None:
+        """Initialize the dispatcher."""
+        self._max_concurrent = max(1, max_concurrent)
+        self._requests_per_minute = max(1, requests_per_minute)
+        self._recent_starts: deque[float] = deque()
+        self._budget_timer: asyncio.TimerHandle | None = None
+        self._lanes: dict[int, deque] = {lane: deque() for lane in PRIORITY_LANES}
+        self._in_flight = 0
+        self._busy_devices: dict[str, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of requests currently running."""
+        return self._in_flight
+
+    @property
+    def pending(self) -> dict[int, int]:
+        """Return the number of queued requests per lane."""
+        return {lane: len(queue) for lane, queue in self._lanes.items()}
+
+    async def submit(
+        self,
+        device_id: str,
+        priority: int,
+        request: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Queue a request and wait for its result."""
+        if priority not in self._lanes:
+            priority = PRIORITY_BACKGROUND
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._lanes[priority].append((device_id, request, future))
+        self._pump()
+        return await future
+
+    def _slots_for(self, priority: int) -> int:
+        """Return how many slots a lane may occupy."""
+        if priority == PRIORITY_SAFETY or self._max_concurrent == 1:
+            return self._max_concurrent
+        return self._max_concurrent - 1
+
+    def _budget_wait(self) -> float:
+        """Return seconds until the per-minute budget has room again."""
+        now = time.monotonic()
+        while self._recent_starts and now - self._recent_starts[0] >= 60:
+            self._recent_starts.popleft()
+        if len(self._recent_starts) < self._requests_per_minute:
+            return 0
+        return 60 - (now - self._recent_starts[0])
+
+    def _retry_after(self, delay: float) -> None:
+        """Pump again once budget frees up."""
+        if self._budget_timer is not None:
+            return
+
+        def _retry() -> None:
+            self._budget_timer = None
+            self._pump()
+
+        self._budget_timer = asyncio.get_running_loop().call_later(delay, _retry)
+
+    def _next_request(self) -> tuple[int, tuple] | None:
+        """Pop the next request that may start now."""
+        for priority in PRIORITY_LANES:
+            if self._in_flight >= self._slots_for(priority):
+                continue
+            if priority != PRIORITY_SAFETY and self._lanes[priority]:
+                wait = self._budget_wait()
+                if wait > 0:
+                    self._retry_after(wait)
+                    continue
+            queue = self._lanes[priority]
+            for item in list(queue):
+                device_id, _request, future = item
+                if future.done():
+                    # Caller went away before the request started
+                    queue.remove(item)
+                    continue
+                if priority != PRIORITY_SAFETY and device_id in self._busy_devices:
+                    continue
+                queue.remove(item)
+                return priority, item
+        return None
+
+    def _pump(self) -> None:
+        """Start as many queued requests as the free slots allow."""
+        while self._in_flight < self._max_concurrent:
+            selected = self._next_request()
+            if selected is None:
+                return
+            priority, (device_id, request, future) = selected
+            self._in_flight += 1
+            self._recent_starts.append(time.monotonic())
+            self._busy_devices[device_id] = self._busy_devices.get(device_id, 0) + 1
+            task = asyncio.create_task(self._run(device_id, request, future))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            _LOGGER.debug(
+                "Dispatched request for %s from lane %s (%s in flight)",
+                device_id, priority, self._in_flight,
+            )
+
+    async def _run(
+        self,
+        device_id: str,
+        request: Callable[[], Awaitable[Any]],
+        future: asyncio.Future,
+    ) -> None:
+        """Run a request and hand its outcome to the waiting caller."""
+        try:
+            result = await request()
+        except Exception as e:  # pylint: disable=broad-except
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+        finally:
+            self._in_flight -= 1
+            if self._busy_devices.get(device_id, 0) > 1:
+                self._busy_devices[device_id] -= 1
+            else:
+                self._busy_devices.pop(device_id, None)
+            self._pump()
+
+
+def get_dispatcher(hass: HomeAssistant, account: str = DEFAULT_ACCOUNT) -> CommandDispatcher:
+    """Return the shared dispatcher for a SmartThings account."""
+    dispatchers = hass.data.setdefault(DOMAIN, {}).setdefault("dispatchers", {})
+    if account not in dispatchers:
+        dispatchers[account] = CommandDispatcher()
+    return dispatchers[account]
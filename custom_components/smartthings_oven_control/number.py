@@ -7,9 +7,17 @@ from typing import Any
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, MIN_TEMP_F, MAX_TEMP_F, MIN_COOK_TIME, MAX_COOK_TIME
+from .const import (
+    DOMAIN,
+    MIN_TEMP_F,
+    MAX_TEMP_F,
+    MIN_COOK_TIME,
+    MAX_COOK_TIME,
+    SIGNAL_FLEET_UPDATED,
+)
 from .oven_entity import SmartThingsOvenEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -98,6 +106,7 @@ class OvenTemperatureNumber(SmartThingsOvenEntity, NumberEntity):
             
             # Store the value in coordinator data for button access
             coordinator["oven_temperature"] = value
+            async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATED, self._device_id)
             
             _LOGGER.debug("Oven temperature set to: %s°F for mode %s", value, current_mode)
         else:
@@ -145,6 +154,7 @@ class OvenCookTimeNumber(SmartThingsOvenEntity, NumberEntity):
             # Store the value in coordinator data for button access
             coordinator = self.hass.data[DOMAIN][self._config_entry.entry_id]
             coordinator["oven_cook_time"] = value
+            async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATED, self._device_id)
             
             _LOGGER.debug("Cook time set to: %s minutes", value)
         else:
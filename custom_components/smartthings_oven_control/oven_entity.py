@@ -36,6 +36,13 @@ class SmartThingsOvenEntity(Entity):
             identifiers={(DOMAIN, self._device_id)},
         )
 
+    def _record_skip(self) -> None:
+        """Count a command that was suppressed as redundant."""
+        attributes = dict(self._attr_extra_state_attributes or {})
+        attributes["skipped_commands"] = attributes.get("skipped_commands", 0) + 1
+        self._attr_extra_state_attributes = attributes
+        self.async_write_ha_state()
+
     @property
     def should_poll(self) -> bool:
         """Disable polling for this entity."""
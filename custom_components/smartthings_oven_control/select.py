@@ -7,9 +7,10 @@ from typing import Any
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, OVEN_MODES
+from .const import DOMAIN, OVEN_MODES, SIGNAL_FLEET_UPDATED
 from .oven_entity import SmartThingsOvenEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -84,6 +85,7 @@ class OvenModeSelect(SmartThingsOvenEntity, SelectEntity):
             # Store the value in coordinator data for button access
             coordinator = self.hass.data[DOMAIN][self._config_entry.entry_id]
             coordinator["oven_mode"] = option
+            async_dispatcher_send(self.hass, SIGNAL_FLEET_UPDATED, self._device_id)
             
             _LOGGER.debug("Oven mode set to: %s", option)
         else:
@@ -0,0 +1,133 @@
+"""Sensor entities for SmartThings Oven Control."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN
+from .cook_state import CookStateEstimator
+from .oven_entity import SmartThingsOvenEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the SmartThings Oven Control sensor entities."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    device_id = coordinator["device_id"]
+    friendly_name = coordinator["friendly_name"]
+    access_token = coordinator["access_token"]
+    cook_state = coordinator["cook_state"]
+
+    async_add_entities([
+        sensor_class(
+            device_id=device_id,
+            friendly_name=friendly_name,
+            access_token=access_token,
+            config_entry=entry,
+            cook_state=cook_state,
+        )
+        for sensor_class in (
+            OvenRemainingTimeSensor,
+            OvenCurrentTemperatureSensor,
+            OvenCookProgressSensor,
+        )
+    ])
+
+
+class OvenCookStateSensor(SmartThingsOvenEntity, SensorEntity):
+    """Base sensor reading from the locally extrapolated cook state."""
+
+    def __init__(
+        self,
+        device_id: str,
+        friendly_name: str,
+        access_token: str,
+        config_entry: ConfigEntry,
+        cook_state: CookStateEstimator,
+    ) -> None:
+        """Initialize the cook state sensor."""
+        super().__init__(
+            device_id=device_id,
+            friendly_name=friendly_name,
+            access_token=access_token,
+            config_entry=config_entry,
+        )
+
+        self._cook_state = cook_state
+
+    async def async_added_to_hass(self) -> None:
+        """Write state whenever the estimate changes."""
+        self.async_on_remove(
+            self._cook_state.async_add_listener(self.async_write_ha_state)
+        )
+
+
+class OvenRemainingTimeSensor(OvenCookStateSensor):
+    """Sensor entity for remaining cook time."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the remaining time sensor."""
+        super().__init__(**kwargs)
+
+        self._attr_unique_id = f"{self._device_id}_oven_remaining_time"
+        self._attr_name = "Remaining Cook Time"
+        self._attr_native_unit_of_measurement = "s"
+
+    @property
+    def device_class(self) -> str | None:
+        """Return the device class."""
+        return "duration"
+
+    @property
+    def native_value(self) -> int:
+        """Return the extrapolated remaining cook time."""
+        return self._cook_state.remaining_time
+
+
+class OvenCurrentTemperatureSensor(OvenCookStateSensor):
+    """Sensor entity for the current cavity temperature."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the current temperature sensor."""
+        super().__init__(**kwargs)
+
+        self._attr_unique_id = f"{self._device_id}_oven_current_temperature"
+        self._attr_name = "Current Temperature"
+        self._attr_native_unit_of_measurement = "°F"
+
+    @property
+    def device_class(self) -> str | None:
+        """Return the device class."""
+        return "temperature"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the projected cavity temperature."""
+        return self._cook_state.temperature
+
+
+class OvenCookProgressSensor(OvenCookStateSensor):
+    """Sensor entity for cook progress."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        """Initialize the cook progress sensor."""
+        super().__init__(**kwargs)
+
+        self._attr_unique_id = f"{self._device_id}_oven_cook_progress"
+        self._attr_name = "Cook Progress"
+        self._attr_native_unit_of_measurement = "%"
+
+    @property
+    def native_value(self) -> int:
+        """Return the extrapolated cook progress."""
+        return self._cook_state.progress
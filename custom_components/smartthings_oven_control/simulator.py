@@ -0,0 +1,304 @@
+"""Thermal-model simulator of DA-KS-RANGE-0101X ovens for offline testing."""
+from __future__ import annotations
+
+import logging
+import random
+import re
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from homeassistant.util import dt as dt_util
+
+from .cassette import CassetteResponse, PendingResponse
+from .const import (
+    MAX_COOK_TIME,
+    MIN_COOK_TIME,
+    OVEN_CLOCK_ATTRIBUTE,
+    OVEN_CLOCK_FORMAT,
+    OVEN_MODES,
+    SMARTTHINGS_API_BASE,
+    TEMPERATURE_RANGES,
+)
+from .thermal import AMBIENT_TEMP_F, cool, heat, target_temperature
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_CLOCK_DRIFT_PPM = 50
+
+_URL_PATTERN = re.compile(r"^/devices/(?P<device_id>[^/]+)(?P<resource>/status|/commands)?$")
+
+
+class CommandError(Exception):
+    """Raised when a virtual oven rejects a command."""
+
+
+class VirtualOven:
+    """A single simulated oven.
+
+    The cavity heats at a rate that is capped by element power and tapers
+    near the setpoint, and cools towards ambient when idle. The cook timer
+    counts down from the start command, and the oven clock drifts from the
+    simulated clock at a small per-device rate. Like the real oven, the
+    status only reports the clock as part of the last ``execute`` result.
+    """
+
+    def __init__(
+        self,
+        device_id: str,
+        clock: Callable[[], float],
+        clock_drift_ppm: float = 0.0,
+        utcnow: Callable[[], datetime] = dt_util.utcnow,
+    ) -> None:
+        """Initialize the virtual oven."""
+        self.device_id = device_id
+        self._clock = clock
+        self._utcnow = utcnow
+        self._updated = clock()
+        self.temperature = AMBIENT_TEMP_F
+        self.machine_state = "ready"
+        self.job_state = "ready"
+        self.mode = "Bake"
+        self.setpoint = 0
+        self.operation_time = 0
+        self.remaining_time = 0.0
+        self._clock_drift = clock_drift_ppm / 1e6
+        self._clock_offset = 0.0
+        self._clock_set_at = self._updated
+        self._execute_data: dict | None = None
+        self._execute_time: datetime | None = None
+
+    def _local_now(self) -> datetime:
+        """Return the simulated naive local time of the host."""
+        return dt_util.as_local(self._utcnow()).replace(tzinfo=None)
+
+    def _advance(self) -> None:
+        """Advance the thermal model and timer to the current time."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        if elapsed <= 0:
+            return
+
+        if self.machine_state == "running":
+            target = target_temperature(self.mode, self.setpoint)
+            self.temperature = heat(self.temperature, target, elapsed)
+            if self.job_state == "preheat" and self.temperature >= target - 1:
+                self.job_state = "cooking"
+
+            self.remaining_time = max(0.0, self.remaining_time - elapsed)
+            if self.remaining_time == 0:
+                self.machine_state = "ready"
+                self.job_state = "finished"
+        else:
+            self.temperature = cool(self.temperature, elapsed)
+
+    def oven_time(self) -> datetime:
+        """Return the oven's (drifting) local wall-clock time."""
+        drift = (self._clock() - self._clock_set_at) * self._clock_drift
+        return self._local_now() + timedelta(seconds=self._clock_offset + drift)
+
+    def execute(self, capability: str, command: str, arguments: list | None) -> None:
+        """Apply a command in the format sent by execute_oven_command."""
+        self._advance()
+        arguments = arguments or []
+
+        if capability == "ovenOperatingState" and command == "start":
+            self._start(*arguments)
+        elif capability == "ovenOperatingState" and command == "stop":
+            self.machine_state = "ready"
+            self.job_state = "ready"
+            self.remaining_time = 0.0
+        elif capability == "ovenOperatingState" and command == "pause":
+            if self.machine_state == "running":
+                self.machine_state = "paused"
+        elif capability == "execute" and command == "execute":
+            self._configure(*arguments)
+        else:
+            raise CommandError(f"Unsupported command {capability}.{command}")
+
+    def _start(self, mode: str = "Bake", cook_time: int = 0, temperature: int = 0) -> None:
+        """Start cooking after validating the program like the real oven."""
+        if mode not in OVEN_MODES:
+            raise CommandError(f"Unsupported oven mode: {mode}")
+        if not MIN_COOK_TIME * 60 <= int(cook_time) <= MAX_COOK_TIME * 60:
+            raise CommandError(f"Cook time out of range: {cook_time}")
+
+        min_temp, max_temp = TEMPERATURE_RANGES[mode]
+        if (min_temp, max_temp) != (0, 0) and not min_temp <= int(temperature) <= max_temp:
+            raise CommandError(
+                f"Temperature {temperature} outside {min_temp}-{max_temp} for {mode}"
+            )
+
+        self.mode = mode
+        self.setpoint = int(temperature) if (min_temp, max_temp) != (0, 0) else 0
+        self.operation_time = int(cook_time)
+        self.remaining_time = float(cook_time)
+        self.machine_state = "running"
+        self.job_state = "preheat"
+
+    def _configure(self, href: str = "", values: dict | None = None) -> None:
+        """Apply a vendor configuration write such as the clock sync."""
+        if href != "/configuration/vs/0" or not isinstance(values, dict):
+            raise CommandError(f"Unsupported configuration resource: {href}")
+        if OVEN_CLOCK_ATTRIBUTE in values:
+            new_time = datetime.strptime(values[OVEN_CLOCK_ATTRIBUTE], OVEN_CLOCK_FORMAT)
+            self._clock_offset = (new_time - self._local_now()).total_seconds()
+            self._clock_set_at = self._clock()
+
+        # The result of the call stays in the status until the next execute
+        self._execute_data = {
+            "href": href,
+            "payload": {OVEN_CLOCK_ATTRIBUTE: self.oven_time().strftime(OVEN_CLOCK_FORMAT)},
+        }
+        self._execute_time = self._utcnow()
+
+    def status(self) -> dict:
+        """Return the device status in SmartThings format."""
+        self._advance()
+        # Timestamps follow simulated time, which runs at the time scale
+        now = self._utcnow()
+        timestamp = now.isoformat()
+
+        def attribute(value: Any, unit: str | None = None) -> dict:
+            result = {"value": value, "timestamp": timestamp}
+            if unit is not None:
+                result["unit"] = unit
+            return result
+
+        progress = 0
+        if self.operation_time:
+            progress = round(100 * (1 - self.remaining_time / self.operation_time))
+        completion = now + timedelta(seconds=self.remaining_time)
+
+        return {
+            "components": {
+                "main": {
+                    "ovenOperatingState": {
+                        "machineState": attribute(self.machine_state),
+                        "ovenJobState": attribute(self.job_state),
+                        "operationTime": attribute(self.operation_time),
+                        "remainingTime": attribute(round(self.remaining_time), "s"),
+                        "progress": attribute(progress, "%"),
+                        "completionTime": attribute(completion.isoformat()),
+                        "supportedMachineStates": attribute(["ready", "running", "paused"]),
+                    },
+                    "ovenMode": {
+                        "ovenMode": attribute(self.mode),
+                        "supportedOvenModes": attribute(OVEN_MODES),
+                    },
+                    "ovenSetpoint": {
+                        "ovenSetpoint": attribute(self.setpoint),
+                    },
+                    "temperatureMeasurement": {
+                        "temperature": attribute(round(self.temperature), "F"),
+                    },
+                    "execute": {
+                        "data": {
+                            "value": self._execute_data,
+                            "timestamp": (self._execute_time or now).isoformat(),
+                        },
+                    },
+                },
+            },
+        }
+
+
+class OvenSimulator:
+    """A fleet of virtual ovens served from one process.
+
+    Ovens are created on first use of their device ID, so any number of
+    config entries can point at the simulator. ``time_scale`` runs simulated
+    time faster than real time for accelerated tests.
+    """
+
+    def __init__(self, time_scale: float = 1.0, seed: int | None = None) -> None:
+        """Initialize the simulator."""
+        self._time_scale = time_scale
+        self._epoch = time.monotonic()
+        self._epoch_utc = dt_util.utcnow()
+        self._random = random.Random(seed)
+        self.ovens: dict[str, VirtualOven] = {}
+
+    def _clock(self) -> float:
+        """Return simulated seconds since the simulator started."""
+        return (time.monotonic() - self._epoch) * self._time_scale
+
+    def _utcnow(self) -> datetime:
+        """Return the simulated UTC time."""
+        return self._epoch_utc + timedelta(seconds=self._clock())
+
+    def get_oven(self, device_id: str) -> VirtualOven:
+        """Return the virtual oven for a device ID, creating it if needed."""
+        if device_id not in self.ovens:
+            drift = self._random.uniform(-MAX_CLOCK_DRIFT_PPM, MAX_CLOCK_DRIFT_PPM)
+            self.ovens[device_id] = VirtualOven(device_id, self._clock, drift, self._utcnow)
+        return self.ovens[device_id]
+
+    def add_ovens(self, count: int, prefix: str = "sim-oven") -> list[str]:
+        """Create ``count`` ovens up front and return their device IDs."""
+        start = len(self.ovens)
+        device_ids = [f"{prefix}-{index:04d}" for index in range(start, start + count)]
+        for device_id in device_ids:
+            self.get_oven(device_id)
+        return device_ids
+
+    def device(self, device_id: str) -> dict:
+        """Return a device description like GET /devices/{id}."""
+        self.get_oven(device_id)
+        return {
+            "deviceId": device_id,
+            "label": f"Virtual Oven {device_id}",
+            "manufacturerName": "Samsung Electronics",
+            "deviceTypeName": "Samsung OCF Range",
+            "ocf": {"modelNumber": "DA-KS-RANGE-0101X"},
+        }
+
+    def command(self, device_id: str, commands: list[dict]) -> dict:
+        """Apply a command payload like POST /devices/{id}/commands."""
+        oven = self.get_oven(device_id)
+        for command in commands:
+            oven.execute(command["capability"], command["command"], command.get("arguments"))
+        return {
+            "results": [
+                {"id": f"{device_id}-{index}", "status": "ACCEPTED"}
+                for index, _ in enumerate(commands)
+            ]
+        }
+
+
+class SimulatorSession:
+    """Session stand-in routing SmartThings API requests to a simulator."""
+
+    def __init__(self, simulator: OvenSimulator) -> None:
+        """Initialize the simulator session."""
+        self._simulator = simulator
+
+    def get(self, url: str, **kwargs: Any) -> PendingResponse:
+        """Serve a GET request from the simulator."""
+        return PendingResponse(lambda: self._respond("GET", url, kwargs.get("json")))
+
+    def post(self, url: str, **kwargs: Any) -> PendingResponse:
+        """Serve a POST request from the simulator."""
+        return PendingResponse(lambda: self._respond("POST", url, kwargs.get("json")))
+
+    async def _respond(self, method: str, url: str, payload: Any) -> CassetteResponse:
+        match = _URL_PATTERN.match(url[len(SMARTTHINGS_API_BASE):])
+        if not url.startswith(SMARTTHINGS_API_BASE) or match is None:
+            return CassetteResponse(404, {"error": {"code": "NotFoundError"}})
+
+        device_id = match["device_id"]
+        resource = match["resource"]
+        try:
+            if method == "GET" and resource is None:
+                return CassetteResponse(200, self._simulator.device(device_id))
+            if method == "GET" and resource == "/status":
+                return CassetteResponse(200, self._simulator.get_oven(device_id).status())
+            if method == "POST" and resource == "/commands":
+                return CassetteResponse(200, self._simulator.command(device_id, payload or []))
+        except (CommandError, KeyError, TypeError, ValueError) as e:
+            _LOGGER.debug("Virtual oven %s rejected request: %s", device_id, e)
+            return CassetteResponse(
+                422, {"error": {"code": "ConstraintViolationError", "message": str(e)}}
+            )
+        return CassetteResponse(405, {"error": {"code": "MethodNotAllowed"}})
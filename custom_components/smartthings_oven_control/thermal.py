@@ -0,0 +1,48 @@
+"""Thermal model of a DA-KS-RANGE-0101X oven cavity."""
+from __future__ import annotations
+
+import math
+
+AMBIENT_TEMP_F = 72.0
+MAX_HEATING_RATE = 0.25  # °F per second with all elements on (~20 min to 350°F)
+HEATING_GAIN = 0.01  # 1/s, how quickly heating tapers near the setpoint
+COOLING_RATE = 0.0012  # 1/s, Newtonian loss to ambient with elements off
+
+# Cavity targets for modes that take no temperature argument
+FIXED_MODE_TEMPS = {
+    "Broil": 550.0,
+    "SelfClean": 880.0,
+    "SteamClean": 212.0,
+}
+
+
+def target_temperature(mode: str, setpoint: float) -> float:
+    """Return the cavity temperature a mode heats towards."""
+    return FIXED_MODE_TEMPS.get(mode, float(setpoint))
+
+
+def heat(temperature: float, target: float, elapsed: float) -> float:
+    """Return the temperature after heating towards a target for some seconds.
+
+    Heating runs at full element power until the gap to the target is small
+    enough for the controller to taper, then closes the gap exponentially.
+    """
+    if temperature >= target or elapsed <= 0:
+        return temperature
+
+    taper_gap = MAX_HEATING_RATE / HEATING_GAIN
+    gap = target - temperature
+    if gap > taper_gap:
+        full_power_time = (gap - taper_gap) / MAX_HEATING_RATE
+        if elapsed <= full_power_time:
+            return temperature + MAX_HEATING_RATE * elapsed
+        elapsed -= full_power_time
+        gap = taper_gap
+    return target - gap * math.exp(-HEATING_GAIN * elapsed)
+
+
+def cool(temperature: float, elapsed: float) -> float:
+    """Return the temperature after cooling towards ambient for some seconds."""
+    if temperature <= AMBIENT_TEMP_F or elapsed <= 0:
+        return temperature
+    return AMBIENT_TEMP_F + (temperature - AMBIENT_TEMP_F) * math.exp(-COOLING_RATE * elapsed)
@@ -12,13 +12,13 @@ from homeassistant.core import HomeAssistant
 _LOGGER = logging.getLogger(__name__)
 
 
-async def get_smartthings_token(hass: HomeAssistant) -> str | None:
-    """Get SmartThings access token from stored config entries."""
+async def get_smartthings_accounts(hass: HomeAssistant) -> dict[str, dict]:
+    """Get all SmartThings accounts with a valid token, keyed by config entry ID."""
     config_entries_file = Path(hass.config.config_dir) / ".storage" / "core.config_entries"
     
     if not config_entries_file.exists():
         _LOGGER.error("Config entries file does not exist: %s", config_entries_file)
-        return None
+        return {}
         
     try:
         # Use hass.async_add_executor_job to run the file operation in a thread pool
@@ -26,27 +26,63 @@ async def get_smartthings_token(hass: HomeAssistant) -> str | None:
         data = await loop.run_in_executor(None, _read_config_file, config_entries_file)
         
         if data is None:
-            return None
+            return {}
         
-        # Find SmartThings config entry
+        accounts = {}
         for entry in data.get('data', {}).get('entries', []):
-            if entry.get('domain') == 'smartthings':
-                token_data = entry.get('data', {}).get('token', {})
-                access_token = token_data.get('access_token')
-                
-                # Check if token is still valid (not expired)
-                expires_at = token_data.get('expires_at')
-                if expires_at and expires_at > time.time():
-                    _LOGGER.debug("Found valid SmartThings token")
-                    return access_token
-                else:
-                    _LOGGER.warning("SmartThings token is expired or missing expiration time")
-                    
-        _LOGGER.error("No valid SmartThings integration found")
-        return None
+            if entry.get('domain') != 'smartthings':
+                continue
+            
+            entry_data = entry.get('data', {})
+            token_data = entry_data.get('token', {})
+            
+            # Check if token is still valid (not expired)
+            expires_at = token_data.get('expires_at')
+            if expires_at and expires_at > time.time():
+                accounts[entry.get('entry_id')] = {
+                    "access_token": token_data.get('access_token'),
+                    "location_id": entry_data.get('location_id'),
+                    "title": entry.get('title', 'SmartThings'),
+                }
+            else:
+                _LOGGER.warning("SmartThings token for %s is expired or missing expiration time",
+                              entry.get('title', entry.get('entry_id')))
+        
+        if not accounts:
+            _LOGGER.error("No valid SmartThings integration found")
+        return accounts
     except Exception as e:
-        _LOGGER.error("Error reading SmartThings token: %s", e)
-        return None
+        _LOGGER.error("Error reading SmartThings tokens: %s", e)
+        return {}
+
+
+async def get_smartthings_account_token(
+    hass: HomeAssistant, account_id: str | None = None
+) -> tuple[str, str] | None:
+    """Get a SmartThings account ID and access token from stored config entries.
+
+    Returns the token of the given SmartThings config entry, or of the first
+    account with a valid token when no account is given, together with the
+    config entry ID of the account it belongs to.
+    """
+    accounts = await get_smartthings_accounts(hass)
+    if account_id is not None:
+        account = accounts.get(account_id)
+        if account is None:
+            _LOGGER.error("No valid token for SmartThings account %s", account_id)
+            return None
+        return account_id, account["access_token"]
+    
+    for entry_id, account in accounts.items():
+        _LOGGER.debug("Found valid SmartThings token")
+        return entry_id, account["access_token"]
+    return None
+
+
+async def get_smartthings_token(hass: HomeAssistant, account_id: str | None = None) -> str | None:
+    """Get SmartThings access token from stored config entries."""
+    account_token = await get_smartthings_account_token(hass, account_id)
+    return account_token[1] if account_token else None
 
 
 def _read_config_file(config_entries_file: Path) -> dict | None:
@@ -0,0 +1,246 @@
+"""Websocket API for fleet dashboards."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+
+from .command_guard import get_cached_status, get_status_info, status_value
+from .const import (
+    DOMAIN,
+    FLEET_DELTA_INTERVAL,
+    FLEET_POLL_INTERVAL,
+    FLEET_STALE_AFTER,
+    SIGNAL_FLEET_UPDATED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+FLEET_COLUMNS = (
+    "device_id",
+    "name",
+    "mode",
+    "setpoint",
+    "cook_time",
+    "operating_state",
+    "available",
+    "last_update",
+    "stale",
+)
+
+
+def _oven_row(hass: HomeAssistant, entry_data: dict) -> dict[str, Any]:
+    """Return the dashboard fields of one oven.
+
+    ``available`` is None until the first status fetch for the device has
+    succeeded or failed. ``stale`` flags rows whose status is missing or too
+    old to trust.
+    """
+    info = get_status_info(hass, entry_data["device_id"])
+    status = info["status"] or {}
+    last_update = info["last_update"]
+    return {
+        "device_id": entry_data["device_id"],
+        "name": entry_data["friendly_name"],
+        "mode": entry_data.get("oven_mode"),
+        "setpoint": entry_data.get("oven_temperature"),
+        "cook_time": entry_data.get("oven_cook_time"),
+        "operating_state": status_value(status, "ovenOperatingState", "machineState"),
+        "available": info["available"],
+        "last_update": last_update,
+        "stale": last_update is None or time.time() - last_update > FLEET_STALE_AFTER,
+    }
+
+
+def _fleet_rows(hass: HomeAssistant) -> dict[str, dict[str, Any]]:
+    """Return the dashboard fields of every loaded oven, keyed by device ID."""
+    domain_data = hass.data.get(DOMAIN, {})
+    rows = {}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        entry_data = domain_data.get(entry.entry_id)
+        if entry_data is not None:
+            rows[entry_data["device_id"]] = _oven_row(hass, entry_data)
+    return rows
+
+
+def _last_update_age(row: dict[str, Any], now: float) -> float | None:
+    """Return the seconds since a row's last status, if it ever had one."""
+    return None if row["last_update"] is None else round(now - row["last_update"], 1)
+
+
+def _columnar(rows: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Return rows as one list per column, plus the age of each last update."""
+    now = time.time()
+    snapshot: dict[str, Any] = {
+        column: [row[column] for row in rows.values()] for column in FLEET_COLUMNS
+    }
+    snapshot["last_update_age"] = [_last_update_age(row, now) for row in rows.values()]
+    snapshot["time"] = now
+    return snapshot
+
+
+class FleetStatusPoller:
+    """Poll the status of every oven while a dashboard is subscribed.
+
+    Ovens otherwise only fetch their status for clock checks and command
+    confirmations, which can leave a dashboard hours behind. Fetches go
+    through the background lane of each account's dispatcher, and ovens
+    with a recent enough status are skipped. Every poll also re-announces
+    all ovens so subscribers notice rows that went stale.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the poller."""
+        self._hass = hass
+        self._subscribers = 0
+        self._unsub_poll: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_add_subscriber(self) -> CALLBACK_TYPE:
+        """Poll until the returned callback is called."""
+        self._subscribers += 1
+        if self._unsub_poll is None:
+            self._unsub_poll = async_track_time_interval(
+                self._hass, self._async_poll, timedelta(seconds=FLEET_POLL_INTERVAL)
+            )
+            self._hass.async_create_task(self._async_poll())
+
+        @callback
+        def remove_subscriber() -> None:
+            self._subscribers -= 1
+            if self._subscribers == 0 and self._unsub_poll is not None:
+                self._unsub_poll()
+                self._unsub_poll = None
+
+        return remove_subscriber
+
+    async def _async_poll(self, _now: datetime | None = None) -> None:
+        """Fetch the status of every oven without a recent one."""
+        from .api_client import get_device_status
+
+        domain_data = self._hass.data.get(DOMAIN, {})
+        entries = [
+            domain_data[entry.entry_id]
+            for entry in self._hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id in domain_data
+        ]
+        results = await asyncio.gather(
+            *(
+                get_device_status(self._hass, entry_data["device_id"], entry_data["access_token"])
+                for entry_data in entries
+                if get_cached_status(
+                    self._hass, entry_data["device_id"], FLEET_POLL_INTERVAL
+                ) is None
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                _LOGGER.debug("Fleet status poll failed: %s", result)
+
+        for entry_data in entries:
+            async_dispatcher_send(self._hass, SIGNAL_FLEET_UPDATED, entry_data["device_id"])
+
+
+def _get_fleet_poller(hass: HomeAssistant) -> FleetStatusPoller:
+    """Return the fleet status poller shared by all subscriptions."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if "fleet_poller" not in domain_data:
+        domain_data["fleet_poller"] = FleetStatusPoller(hass)
+    return domain_data["fleet_poller"]
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the fleet websocket commands."""
+    websocket_api.async_register_command(hass, websocket_fleet_status)
+    websocket_api.async_register_command(hass, websocket_fleet_subscribe)
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/fleet_status"})
+@callback
+def websocket_fleet_status(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return a columnar snapshot of every oven."""
+    connection.send_result(msg["id"], _columnar(_fleet_rows(hass)))
+
+
+@websocket_api.websocket_command({vol.Required("type"): f"{DOMAIN}/fleet_subscribe"})
+@callback
+def websocket_fleet_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send a snapshot, then batched per-oven deltas as ovens change.
+
+    Each delta event maps device IDs to only the fields that changed since
+    the previous message, plus the current ``last_update_age``; a device
+    that was removed maps to None. Statuses are polled while subscribed.
+    """
+    sent = _fleet_rows(hass)
+    dirty: set[str] = set()
+    unsub_flush: CALLBACK_TYPE | None = None
+
+    @callback
+    def flush(_now: Any = None) -> None:
+        nonlocal unsub_flush
+        unsub_flush = None
+        now = time.time()
+        current = _fleet_rows(hass)
+        deltas: dict[str, dict[str, Any] | None] = {}
+        for device_id in dirty:
+            row = current.get(device_id)
+            if row is None:
+                if sent.pop(device_id, None) is not None:
+                    deltas[device_id] = None
+                continue
+            previous = sent.get(device_id, {})
+            changed = {
+                column: value for column, value in row.items()
+                if previous.get(column) != value
+            }
+            if changed:
+                deltas[device_id] = {**changed, "last_update_age": _last_update_age(row, now)}
+                sent[device_id] = row
+        dirty.clear()
+        if deltas:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], {"deltas": deltas, "time": now})
+            )
+
+    @callback
+    def handle_update(device_id: str) -> None:
+        nonlocal unsub_flush
+        dirty.add(device_id)
+        if unsub_flush is None:
+            unsub_flush = async_call_later(hass, FLEET_DELTA_INTERVAL, flush)
+
+    unsub_signal = async_dispatcher_connect(hass, SIGNAL_FLEET_UPDATED, handle_update)
+    unsub_poll = _get_fleet_poller(hass).async_add_subscriber()
+
+    @callback
+    def unsubscribe() -> None:
+        unsub_signal()
+        unsub_poll()
+        if unsub_flush is not None:
+            unsub_flush()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(msg["id"], {"snapshot": _columnar(sent)})
+    )